@@ -9,7 +9,6 @@ Usage:
 """
 
 import sys
-import traceback
 from pathlib import Path
 from colorama import init, Fore, Style
 import logging
@@ -44,7 +43,7 @@ def main():
         logger.info("BinanceExchangeClient instantiated successfully")
     except Exception as e:
         logger.error(f"❌ Failed to initialize BinanceExchangeClient: {e}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
         return
 
     # Test: get_contracts
@@ -54,7 +53,7 @@ def main():
         logger.info(f"✅ Retrieved {len(contracts)} contracts")
     except Exception as e:
         logger.error(f"❌ Error fetching contracts: {e}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test: get_balances
     print_test_header("Retrieving account balances")
@@ -65,7 +64,7 @@ def main():
             logger.info(f"  {asset}: free={bal.free}, locked={bal.locked}")
     except Exception as e:
         logger.error(f"❌ Error retrieving balances: {e}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test: get_bid_ask
     print_test_header(f"Getting bid/ask for {TEST_SYMBOL}")
@@ -81,7 +80,7 @@ def main():
                 logger.error("❌ No bid/ask data returned")
     except Exception as e:
         logger.error(f"❌ Error getting bid/ask: {e}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     # Test: get_historical_candles
     print_test_header(f"Fetching historical candles for {TEST_SYMBOL} (1h interval)")
@@ -90,7 +89,7 @@ def main():
         logger.info(f"✅ Retrieved {len(candle_list)} candles")
     except Exception as e:
         logger.error(f"❌ Error fetching candles: {e}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
 
     logger.info("\nDiagnostic completed.")
 
@@ -3,12 +3,15 @@ import requests
 import time
 import typing
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urlencode
 import hmac
 import hashlib
 import websocket  # requires `pip install websocket-client`
 import json
 import threading
+from collections import defaultdict, deque
 
 from models import Contract, Balance, Candle, OrderStatus  # uses dataclass factories
 from secret_keys import Secrets
@@ -40,8 +43,24 @@ class BinanceExchangeClient:
 
         self._headers = {"X-MBX-APIKEY": self._public_key}
 
+        # Pooled keep-alive session: one TCP+TLS handshake reused across REST calls.
+        # urllib3 only retries idempotent methods by default, so orders are never re-sent.
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+        self._session.headers["Connection"] = "keep-alive"
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            backoff_jitter=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+        )
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        )
+
         # Initialize data
-        self.logs = []  # Initialize logs list
+        self.log_queue: typing.Deque[str] = deque()  # Messages for the UI log panel, drained by the interface
         self.prices = {}  # Initialize prices dictionary
         
         # Load data
@@ -51,6 +70,9 @@ class BinanceExchangeClient:
         # Start websocket thread
         self._ws_id = 1
         self._ws = None
+        self.ws_connected = False
+        # Channel -> symbols subscribed on the current connection
+        self.ws_subscriptions: typing.Dict[str, typing.Set[str]] = defaultdict(set)
         t = threading.Thread(target=self._start_ws)
         t.daemon = True
         t.start()
@@ -67,7 +89,7 @@ class BinanceExchangeClient:
 
     def _add_log(self, msg: str):
         logger.info(msg)
-        self.logs.append({"log": msg, "displayed": False})
+        self.log_queue.append(msg)
 
     def _generate_signature(self, params: typing.Dict) -> str:
         return hmac.new(
@@ -76,26 +98,22 @@ class BinanceExchangeClient:
 
     def _make_request(self, method: str, endpoint: str, params: typing.Dict):
         url = self._base_url + endpoint
+        if method not in ("GET", "POST", "DELETE"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
         try:
-            if method == "GET":
-                resp = requests.get(url, params=params, headers=self._headers)
-            elif method == "POST":
-                resp = requests.post(url, params=params, headers=self._headers)
-            elif method == "DELETE":
-                resp = requests.delete(url, params=params, headers=self._headers)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+            resp = self._session.request(method, url, params=params)
         except Exception as e:
             logger.error("Connection error %s %s: %s", method, endpoint, e)
             return None
 
         if resp.status_code == 200:
-            return resp.json()
+            # Decode straight from the body bytes, skipping resp.json()'s encoding guess and str copy
+            return json.loads(resp.content)
         logger.error(
             "API error %s %s: %s (code %s)",
             method,
             endpoint,
-            resp.text,
+            resp.content,  # raw bytes: skips the charset detection behind resp.text
             resp.status_code,
         )
         return None
@@ -140,7 +158,7 @@ class BinanceExchangeClient:
             
         logger.info("Fetching account balances from Binance.US...")
         
-        ts = int(time.time() * 1000)
+        ts = time.time_ns() // 1_000_000
         params = {"timestamp": ts}
         params["signature"] = self._generate_signature(params)
         data = self._make_request("GET", "/api/v3/account", params)
@@ -272,7 +290,7 @@ class BinanceExchangeClient:
         if tif:
             params["timeInForce"] = tif
             
-        params["timestamp"] = int(time.time() * 1000)
+        params["timestamp"] = time.time_ns() // 1_000_000
         params["signature"] = self._generate_signature(params)
         
         result = self._make_request("POST", "/api/v3/order", params)
@@ -305,7 +323,7 @@ class BinanceExchangeClient:
         params = {
             "symbol": contract.symbol,
             "orderId": order_id,
-            "timestamp": int(time.time() * 1000),
+            "timestamp": time.time_ns() // 1_000_000,
         }
         params["signature"] = self._generate_signature(params)
         
@@ -339,7 +357,7 @@ class BinanceExchangeClient:
         params = {
             "symbol": contract.symbol,
             "orderId": order_id,
-            "timestamp": int(time.time() * 1000),
+            "timestamp": time.time_ns() // 1_000_000,
         }
         params["signature"] = self._generate_signature(params)
         
@@ -371,7 +389,8 @@ class BinanceExchangeClient:
             
             while True:
                 try:
-                    self._ws.run_forever()
+                    # Text frames are handed to _on_message as raw bytes, json.loads decodes them itself
+                    self._ws.run_forever(skip_utf8_validation=True)
                 except Exception as e:
                     logger.error(f"WebSocket error: {e}")
                 time.sleep(2)
@@ -382,11 +401,15 @@ class BinanceExchangeClient:
         """Called when WebSocket connection opens"""
         logger.info("Binance.US WebSocket connection established successfully")
         self._add_log("Binance.US market data stream connected")
+        self.ws_connected = True
         self.subscribe_channel(list(self.contracts.values()), "bookTicker")
 
     def _on_close(self, ws, close_status_code=None, close_msg=None):
         """Called when WebSocket connection closes"""
         close_info = f" (Code: {close_status_code})" if close_status_code else ""
+        # Subscriptions do not survive the connection; _on_open subscribes again on reconnect
+        self.ws_connected = False
+        self.ws_subscriptions.clear()
         logger.warning(f"Binance.US WebSocket connection closed{close_info}")
         self._add_log(f"Binance.US market data stream disconnected{close_info}")
 
@@ -395,8 +418,8 @@ class BinanceExchangeClient:
         logger.error(f"Binance.US WebSocket error: {error}")
         self._add_log(f"Binance.US WebSocket error: {str(error)}")
 
-    def _on_message(self, ws, msg: str):
-        """Process incoming WebSocket messages"""
+    def _on_message(self, ws, msg: bytes):
+        """Process incoming WebSocket messages (raw frame bytes)"""
         try:
             data = json.loads(msg)
             
@@ -428,6 +451,7 @@ class BinanceExchangeClient:
         
         try:
             self._ws.send(json.dumps(payload))
+            self.ws_subscriptions[channel].update(c.symbol for c in contracts)
             logger.info(f"Subscription request sent for {len(contracts)} contracts")
         except Exception as e:
             logger.error(f"Subscribe error: {e}")
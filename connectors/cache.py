@@ -0,0 +1,79 @@
+"""
+Small caches for REST responses that can be safely reused: in memory for a short while,
+or on disk for data that stays valid across restarts.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe mapping whose entries expire after their own time-to-live (None never expires).
+    The oldest entry is evicted once maxsize is reached.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self._maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[Optional[float], Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float]):
+        with self._lock:
+            if key not in self._data and len(self._data) >= self._maxsize:
+                del self._data[next(iter(self._data))]
+            expires_at = None if ttl is None else time.monotonic() + ttl
+            self._data[key] = (expires_at, value)
+
+
+class FileCache:
+    """
+    JSON-serialisable values kept on disk, one file per key, so they survive a restart.
+    Expiry is wall-clock (None never expires); unreadable or corrupt files count as a miss.
+    """
+
+    def __init__(self, directory: str = ".cache"):
+        self._directory = directory
+
+    def _path(self, key: Hashable) -> str:
+        name = hashlib.md5(repr(key).encode()).hexdigest()
+        return os.path.join(self._directory, name + ".json")
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                expires_at, value = json.load(f)
+        except (OSError, ValueError):
+            return default
+        if expires_at is not None and time.time() >= expires_at:
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float]):
+        expires_at = None if ttl is None else time.time() + ttl
+        payload = json.dumps([expires_at, value], separators=(",", ":"))
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            # Write to a temporary file first so a concurrent reader never sees a partial entry
+            fd, tmp = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            pass
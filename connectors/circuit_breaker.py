@@ -0,0 +1,75 @@
+"""
+Circuit breaker that makes calls to an unavailable remote service fail fast.
+"""
+
+import threading
+import time
+from typing import Any, Callable
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the remote service while the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    CLOSED: calls go through and consecutive failures are counted.
+    OPEN: after failure_threshold consecutive failures, calls raise CircuitOpenError immediately
+    until reset_timeout seconds have elapsed.
+    HALF_OPEN: up to half_open_probes calls are let through; a success closes the circuit,
+    a failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 10.0,
+                 half_open_probes: int = 1):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call func through the breaker. Any exception it raises counts as a failure and is re-raised.
+        """
+        self._before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self._on_failure()
+            raise
+        self._on_success()
+        return result
+
+    def _before_call(self):
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    raise CircuitOpenError(f"{self.name} circuit is open")
+                self.state = self.HALF_OPEN
+                self._probes = 0
+            if self.state == self.HALF_OPEN:
+                if self._probes >= self.half_open_probes:
+                    raise CircuitOpenError(f"{self.name} circuit is half-open, probe in progress")
+                self._probes += 1
+
+    def _on_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+
+    def _on_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
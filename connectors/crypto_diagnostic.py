@@ -1,5 +1,4 @@
 import sys
-import traceback
 from pathlib import Path
 import logging
 from colorama import init, Fore, Style
@@ -60,7 +59,7 @@ def run_test(name: str, func, ignore_warnings: bool = False):
     except Exception as e:
         passed = False
         msg = str(e)
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
     finally:
         if handler:
             root_logger.removeHandler(handler)
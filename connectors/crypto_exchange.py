@@ -1,19 +1,176 @@
 import time
-import hmac
+import functools
+import operator
+import itertools
 import hashlib
 import logging
+import ssl
 import threading
 import json
+import random
+import uuid
+import numpy as np
+from collections import defaultdict, deque
 import requests
 import websocket
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from urllib3.connectionpool import HTTPSConnectionPool
+from urllib3.exceptions import EmptyPoolError
+from urllib3.util.retry import Retry
 
+from connectors.cache import FileCache, TTLCache
+from connectors.circuit_breaker import CircuitBreaker, CircuitOpenError
+from connectors.json_stream import iter_array_items
+from connectors.order_book import OrderBook
 from secret_keys import Secrets
-from models import Candle, Contract, Balance, OrderStatus
+from models import (
+    CANDLE_DTYPE, Candle, Contract, Balance, OrderStatus, OrderType, Side, candles_from_array
+)
 
+# Level comes from the application's logging setup (main.py), so the debug guards below take effect
 logger = logging.getLogger(__name__)
-# Enable debug logging for this module
-logger.setLevel(logging.DEBUG)
+
+# requests timeout as (connect, read) seconds
+Timeout = Tuple[float, float]
+
+def _log_sha256_backend():
+    """
+    Log which SHA-256 implementation signs requests. hashlib backed by OpenSSL picks its SHA-NI or
+    AVX2 code path on its own; a Python built without OpenSSL falls back to a much slower builtin.
+    """
+    if hashlib.sha256.__module__ != "_hashlib":
+        logger.warning("hashlib is not backed by OpenSSL: request signing uses the slow builtin SHA-256")
+        return
+    sha_ext = "unknown"
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    sha_ext = "yes" if " sha_ni" in line else "no"
+                    break
+    except OSError:
+        pass
+    logger.info("Request signing uses %s SHA-256 (CPU SHA extensions: %s)", ssl.OPENSSL_VERSION, sha_ext)
+
+
+# Shared compact encoder for signed request bodies; payloads are plain trees, so the cycle check is skipped
+_encode_json = json.JSONEncoder(separators=(",", ":"), check_circular=False).encode
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    """
+    Blocking pool that gives up after pool_timeout seconds. requests never passes a pool timeout, so
+    a plain blocking pool would hang every caller for good once its connections leak.
+    """
+    pool_timeout = 10.0
+
+    def _get_conn(self, timeout=None):
+        return super()._get_conn(self.pool_timeout if timeout is None else timeout)
+
+
+class _PoolTimeoutAdapter(HTTPAdapter):
+    """
+    HTTPAdapter on _TimedHTTPSConnectionPool that reports an exhausted pool as requests.ConnectionError.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            **self.poolmanager.pool_classes_by_scheme,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+    def send(self, request, *args, **kwargs):
+        try:
+            return super().send(request, *args, **kwargs)
+        except EmptyPoolError as e:
+            raise requests.ConnectionError(e, request=request)
+
+
+# Candle timeframes accepted by get-candlestick, in milliseconds ("1D" etc. are the exchange's own spelling)
+_INTERVAL_MS = {
+    "1m": 60_000, "5m": 300_000, "15m": 900_000, "30m": 1_800_000,
+    "1h": 3_600_000, "2h": 7_200_000, "4h": 14_400_000, "12h": 43_200_000,
+    "1d": 86_400_000, "7d": 604_800_000, "14d": 1_209_600_000, "1M": 2_592_000_000,
+    "1D": 86_400_000, "7D": 604_800_000, "14D": 1_209_600_000,
+}
+
+
+class _FrozenDict(tuple):
+    """
+    Key-sorted (key, value) pairs of a frozen dict; a distinct type so _params_to_str can tell
+    dicts from lists, which freeze to plain tuples.
+    """
+    __slots__ = ()
+
+
+def _freeze(obj: Any) -> Any:
+    """
+    Turn request params into a hashable tree for _params_to_str: dicts become _FrozenDicts,
+    lists become tuples and scalars their signature string ("null" for None).
+    """
+    if isinstance(obj, str):
+        return obj
+    if isinstance(obj, dict):
+        return _FrozenDict(sorted(((k, _freeze(v)) for k, v in obj.items()), key=operator.itemgetter(0)))
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return "null" if obj is None else str(obj)
+
+
+@functools.lru_cache(maxsize=256)
+def _params_to_str(frozen: _FrozenDict) -> str:
+    """
+    Signature encoding of frozen params: each key followed by its value, dicts expanded the same
+    way in key order and list values encoded as the concatenation of their items.
+    Polled calls with identical params hit the cache.
+    Walks the tree with an explicit stack and joins once at the end.
+    """
+    parts = []
+    append = parts.append
+    # Pushed in reverse so pops come out in order
+    pending = [frozen]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, str):
+            append(node)
+        elif isinstance(node, _FrozenDict):
+            for key, value in reversed(node):
+                pending.append(value)
+                pending.append(key)
+        else:
+            pending.extend(reversed(node))
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=64)
+def _sorted_keys(keys: tuple) -> tuple:
+    # Request params come in a handful of fixed layouts, so each layout is sorted only once
+    return keys if len(keys) < 2 else tuple(sorted(keys))
+
+
+def _encode_params(params: Dict[str, Any]) -> str:
+    """
+    Signature encoding of request params. Flat params, as sent by order calls, are encoded
+    directly: their unique client_oid would miss the _params_to_str cache anyway.
+    """
+    keys = _sorted_keys(tuple(params))
+    try:
+        # Order calls send string values only: one concatenation per pair, no per-value type checks
+        return "".join([key + params[key] for key in keys])
+    except TypeError:
+        pass
+    parts = []
+    for key in keys:
+        value = params[key]
+        if isinstance(value, (dict, list)):
+            return _params_to_str(_freeze(params))
+        parts.append(key)
+        parts.append(value if isinstance(value, str) else "null" if value is None else str(value))
+    return "".join(parts)
+
 
 class CryptoExchangeClient:
     """
@@ -24,7 +181,51 @@ class CryptoExchangeClient:
     WS_MARKET = "wss://stream.crypto.com/exchange/v1/market"
     WS_USER = "wss://stream.crypto.com/exchange/v1/user"
 
-    def __init__(self):
+    # API-level code returned when the signature/nonce is rejected; a fresh nonce usually fixes it
+    AUTH_FAILURE_CODE = 40101
+    RPC_ATTEMPTS = 3
+    # Authentication retries back off exponentially from this many seconds, capped, with jitter
+    AUTH_BACKOFF_BASE = 0.5
+    AUTH_BACKOFF_MAX = 4.0
+    HMAC_BLOCK_SIZE = 64
+    # Failures a public fetch turns into an empty result: transport, open breaker, malformed payload.
+    # Anything else is a bug and propagates.
+    FETCH_ERRORS = (requests.RequestException, CircuitOpenError, ValueError, KeyError, TypeError)
+    # Connections kept per pool, public market data vs private trading. The public pool has room
+    # for the REST workers plus the UI loop and strategy threads calling in at the same time.
+    PUBLIC_POOL_SIZE = 16
+    PRIVATE_POOL_SIZE = 5
+    # Concurrent public requests; stays below PUBLIC_POOL_SIZE
+    REST_WORKERS = 8
+    # Seconds a REST response is reused before hitting the network again
+    CANDLES_CACHE_TTL = 5.0
+    INSTRUMENTS_FILE_TTL = 3600.0
+    FILE_CACHE_DIR = ".cache"
+    TRADES_CACHE_TTL = 1.0
+    BID_ASK_TTL = 0.25
+    # Market socket: book depth kept locally and recent trades buffered per instrument
+    BOOK_DEPTH = 10
+    BOOK_UPDATE_FREQUENCY_MS = 10
+    TRADE_BUFFER = 200
+    WS_RECONNECT_MIN = 1.0
+    WS_RECONNECT_MAX = 30.0
+    # Trades/candles requested in at least this number are stream-parsed instead of loaded whole
+    STREAM_MIN_COUNT = 100
+    STREAM_CHUNK_SIZE = 64 * 1024
+    # Default (connect, read) timeouts, a little above the observed p95 of each endpoint group
+    BOOK_TIMEOUT: Timeout = (1.0, 1.5)
+    HISTORY_TIMEOUT: Timeout = (1.0, 4.0)
+    PRIVATE_TIMEOUT: Timeout = (1.0, 3.0)
+    # Successful response times kept per endpoint for latency_p95
+    LATENCY_SAMPLES = 200
+
+    def __init__(
+        self,
+        book_timeout: Timeout = BOOK_TIMEOUT,
+        history_timeout: Timeout = HISTORY_TIMEOUT,
+        private_timeout: Timeout = PRIVATE_TIMEOUT,
+        bid_ask_ttl: float = BID_ASK_TTL,
+    ):
         # Load credentials exclusively from environment
         self.api_key = Secrets.CRYPTO_API_KEY
         self.api_secret = Secrets.CRYPTO_API_SECRET
@@ -33,180 +234,538 @@ class CryptoExchangeClient:
                 "CRYPTO_API_KEY and CRYPTO_API_SECRET must be set in environment for private endpoints"
             )
         logger.info("API credentials loaded from environment; private endpoints enabled.")
+        _log_sha256_backend()
+        # HMAC-SHA256 (RFC 2104) precomputed by hand: the inner and outer hashes are fed the padded
+        # key once here and copied per signature, skipping the hmac module's Python wrapper
+        key = self.api_secret.encode()
+        if len(key) > self.HMAC_BLOCK_SIZE:
+            key = hashlib.sha256(key).digest()
+        key = key.ljust(self.HMAC_BLOCK_SIZE, b"\0")
+        self._hmac_inner = hashlib.sha256(bytes(b ^ 0x36 for b in key))
+        self._hmac_outer = hashlib.sha256(bytes(b ^ 0x5C for b in key))
 
         self.base_url = self.REST_URL
         self.ws_market_url = self.WS_MARKET
         self.ws_user_url = self.WS_USER
 
-        self.session = requests.Session()
+        self._url_instruments = f"{self.base_url}/public/get-instruments"
+        self._url_book = f"{self.base_url}/public/get-book"
+        self._url_trades = f"{self.base_url}/public/get-trades"
+        self._url_candles = f"{self.base_url}/public/get-candlestick"
+        # Signed endpoint URLs, built once; _rpc adds any other method on first use
+        self._rpc_urls: Dict[str, str] = {
+            method: f"{self.base_url}/{method}"
+            for method in (
+                "private/user-balance",
+                "private/create-order",
+                "private/cancel-order",
+                "private/get-order-detail",
+            )
+        }
+
+        self.book_timeout = book_timeout
+        self.history_timeout = history_timeout
+        self.private_timeout = private_timeout
+        self._bid_ask_ttl = bid_ask_ttl
+        self._latency: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=self.LATENCY_SAMPLES))
+
+        # Bulkhead: market data and trading calls get separate connection pools, so slow
+        # candle/trade downloads can never hold the sockets an order or a cancel needs
+        self.session = self._new_session(self.PUBLIC_POOL_SIZE)
+        # Orders always carry a client_oid the exchange deduplicates on, so private calls
+        # share the same transport retries as public ones
+        self._private_session = self._new_session(self.PRIVATE_POOL_SIZE)
+        self._private_session.headers["Content-Type"] = "application/json"
+
+        self._last_nonce = 0
+        self._nonce_lock = threading.Lock()
+
         self.contracts: Dict[str, Contract] = {}
         self.balances: Dict[str, Balance] = {}
+        # Last bid/ask per symbol; "_ts" is the time.monotonic() at which it was received
         self.prices: Dict[str, Dict[str, float]] = {}
-        self.logs: List[Dict[str, Union[str, bool]]] = []
+        # Messages for the UI log panel, drained by the interface
+        self.log_queue: Deque[str] = deque()
+
+        # Overlaps the network round-trips of multi-symbol public requests
+        self._executor = ThreadPoolExecutor(max_workers=self.REST_WORKERS, thread_name_prefix="crypto-rest")
+        # Symbols with a request_bid_ask fetch in flight, so repeated requests do not pile up
+        self._bid_ask_pending: Set[str] = set()
+        # Sized to the private pool, which also caps how many signed calls are in flight at once
+        self._rpc_executor = ThreadPoolExecutor(max_workers=self.PRIVATE_POOL_SIZE, thread_name_prefix="crypto-rpc")
+        self._rest_cache = TTLCache(maxsize=512)
+        self._file_cache = FileCache(self.FILE_CACHE_DIR)
+        # Fail fast during an exchange outage instead of paying a full timeout on every call
+        self._public_breaker = CircuitBreaker("crypto.com public REST", failure_threshold=5, reset_timeout=10.0)
+        self._private_breaker = CircuitBreaker("crypto.com private RPC", failure_threshold=5, reset_timeout=10.0)
 
+        # Load contracts before the socket opens so _on_open can subscribe from self.contracts
         self._initialize_data()
+        self._ws: Optional[websocket.WebSocketApp] = None
+        self._ws_connected = False
+        self._ws_opened = False
+        # Market socket channels (book.X.10, trade.X) and the state they keep current; the state
+        # only exists while the socket is connected, so whatever is in it can be served as is
+        # _ws_channels is written from the REST executor and the Tk thread and read from the WS thread
+        self._ws_channels: Set[str] = set()
+        self._ws_channels_lock = threading.Lock()
+        self._books: Dict[str, OrderBook] = {}
+        self._trades: Dict[str, Deque[Dict[str, Any]]] = {}
         threading.Thread(target=self._start_ws, daemon=True).start()
         logger.info("CryptoExchangeClient initialized.")
 
+    @staticmethod
+    def _new_session(pool_maxsize: int) -> requests.Session:
+        """
+        Session with its own bounded connection pool. Transport-level retries (connection errors, 429/5xx)
+        are handled by urllib3 with jittered exponential backoff, honouring Retry-After.
+        """
+        session = requests.Session()
+        session.headers["Connection"] = "keep-alive"
+        session.headers["User-Agent"] = "udemy-python-trader/0.1"
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            backoff_jitter=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        # One host per session, so a single pool. pool_block: extra concurrent callers wait for a
+        # kept-alive connection instead of paying a fresh TCP+TLS handshake for a throwaway socket,
+        # for at most _TimedHTTPSConnectionPool.pool_timeout seconds
+        session.mount(
+            "https://",
+            _PoolTimeoutAdapter(pool_connections=1, pool_maxsize=pool_maxsize, pool_block=True, max_retries=retry),
+        )
+        return session
+
+    def latency_p95(self, url: str) -> Optional[float]:
+        """
+        95th percentile of recent successful response times for url, in seconds, or None before
+        any sample. Use it to re-tune the constructor timeouts.
+        """
+        samples = self._latency.get(url)
+        if not samples:
+            return None
+        return float(np.percentile(samples, 95))
+
     def _add_log(self, msg: str):
         logger.info(msg)
-        self.logs.append({"log": msg, "displayed": False})
+        self.log_queue.append(msg)
 
     def _get_nonce(self) -> int:
-        return int(time.time() * 1000)
+        """
+        Millisecond nonce, strictly increasing so bursts within the same millisecond stay unique.
+        """
+        with self._nonce_lock:
+            nonce = max(time.time_ns() // 1_000_000, self._last_nonce + 1)
+            self._last_nonce = nonce
+        return nonce
 
     def _sign(self, method: str, params: Dict[str, Any], nonce: int) -> str:
         """
         Build and log the signature base string, then return the HMAC-SHA256 signature.
         """
         # Build parameter string: sorted keys, concatenate key+value
-        param_str = ''.join(f"{k}{params[k]}" for k in sorted(params)) if params else ''
-        # Base string for signature
-        base = f"{method}{nonce}{self.api_key}{param_str}{nonce}"
-        logger.debug(f"Signature base string: {base}")
-        signature = hmac.new(
-            self.api_secret.encode(), base.encode(), hashlib.sha256
-        ).hexdigest()
-        logger.debug(f"Computed signature: {signature}")
+        param_str = _encode_params(params) if params else ''
+        # Base string for signature; the nonce is stringified once for both of its slots
+        nonce_str = str(nonce)
+        base = "".join((method, nonce_str, self.api_key, param_str, nonce_str))
+        inner = self._hmac_inner.copy()
+        inner.update(base.encode())
+        outer = self._hmac_outer.copy()
+        outer.update(inner.digest())
+        signature = outer.hexdigest()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Signature base string: %s", base)
+            logger.debug("Computed signature: %s", signature)
         return signature
 
-    def _rpc(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        # JSON-RPC call with simple retry logic
-        for i in range(3):
-            nonce = self._get_nonce()
-            sig = self._sign(method, params or {}, nonce)
-            payload = {
-                "id": nonce,
-                "method": method,
-                "api_key": self.api_key,
-                "params": params or {},
-                "nonce": nonce,
-                "sig": sig,
-            }
-            logger.debug(f"RPC payload for {method}: {json.dumps(payload)}")
+    def _signed_body(self, method: str, params: Dict[str, Any]) -> bytes:
+        """
+        JSON-RPC request body signed with a fresh nonce, serialised once and compact.
+        """
+        nonce = self._get_nonce()
+        payload = {
+            "id": nonce,
+            "method": method,
+            "api_key": self.api_key,
+            "params": params,
+            "nonce": nonce,
+            "sig": self._sign(method, params, nonce),
+        }
+        return _encode_json(payload).encode()
+
+    def _rpc(self, method: str, params: Dict[str, Any], body: Optional[bytes] = None) -> Dict[str, Any]:
+        """
+        Signed JSON-RPC call. Transport errors are retried by the session adapter,
+        only an authentication rejection is retried here, with a fresh nonce.
+        body is an already signed first attempt, as prepared by batch().
+        """
+        params = params or {}
+        url = self._rpc_urls.get(method)
+        if url is None:
+            url = self._rpc_urls.setdefault(method, f"{self.base_url}/{method}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for attempt in range(1, self.RPC_ATTEMPTS + 1):
+            if body is None:
+                body = self._signed_body(method, params)
+            if debug:
+                logger.debug("RPC payload for %s: %s", method, body)
             try:
-                resp = self.session.post(
-                    f"{self.base_url}/{method}", json=payload, timeout=10
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                logger.debug(f"RPC response for {method}: {json.dumps(data)}")
-                if data.get("code", 0) != 0:
-                    raise ValueError(f"API error {data['code']}: {data.get('message')}")
+                resp = self._private_breaker.call(self._post, url, body)
+                data = json.loads(resp.content)
+            except (requests.RequestException, ValueError, CircuitOpenError) as e:
+                logger.error("RPC %s failed: %s", method, e)
+                return {}
+            if debug:
+                logger.debug("RPC response for %s: %s", method, resp.content)
+
+            code = data.get("code", 0)
+            if resp.ok and code == 0:
                 return data.get("result", {})
-            except Exception as e:
-                logger.warning(f"RPC {method} attempt {i+1} failed: {e}")
-                time.sleep(0.5 * (i + 1))
-        logger.error(f"RPC {method} failed after retries")
+            if code != self.AUTH_FAILURE_CODE:
+                logger.error(
+                    "RPC %s failed: HTTP %s, API error %s: %s", method, resp.status_code, code, data.get("message")
+                )
+                return {}
+            logger.warning("RPC %s attempt %d rejected by authentication, retrying", method, attempt)
+            body = None
+            if attempt < self.RPC_ATTEMPTS:
+                # Jitter keeps clients that all failed together (e.g. after a key rotation) from retrying in step
+                delay = min(self.AUTH_BACKOFF_BASE * 2 ** (attempt - 1), self.AUTH_BACKOFF_MAX)
+                time.sleep(delay * (0.5 + random.random() * 0.5))
+        logger.error("RPC %s failed after %d attempts", method, self.RPC_ATTEMPTS)
         return {}
 
+    def batch(self, ops: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Run several signed calls concurrently, e.g. cancel the old legs and place the new ones of
+        a strategy update in about one round-trip. Each op is (method, params) and is signed with
+        its own nonce; results come back in the order of ops, {} for a failed call.
+        All payloads are signed up front in one pass, so the workers only do network I/O.
+        """
+        ops = [(method, params or {}) for method, params in ops]
+        bodies = [self._signed_body(method, params) for method, params in ops]
+        return list(self._rpc_executor.map(
+            lambda op, body: self._rpc(op[0], op[1], body), ops, bodies
+        ))
+
+    def _post(self, url: str, body: bytes) -> requests.Response:
+        # Transport and server errors count as failures for the circuit breaker, API errors do not
+        resp = self._private_session.post(url, data=body, timeout=self.private_timeout)
+        if resp.status_code >= 500:
+            resp.raise_for_status()
+        self._latency[url].append(resp.elapsed.total_seconds())
+        return resp
+
     def _initialize_data(self):
+        # Independent public and signed calls: overlap the two round-trips instead of paying both
+        balances = self._rpc_executor.submit(self._load_balances)
         self.contracts = self._load_contracts()
-        self.balances = self._load_balances()
+        self.balances = balances.result()
 
     # Public REST endpoints
-    def get_instruments(self) -> List[Dict[str, Any]]:
-        resp = self.session.get(
-            f"{self.base_url}/public/get-instruments", timeout=10
-        )
+    def _get_data(
+        self, url: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[Timeout] = None
+    ) -> Any:
+        """
+        GET a public endpoint and return its result.data payload. The body is decoded straight
+        from the raw bytes, skipping the str decode done by resp.json().
+        """
+        resp = self._public_breaker.call(self._get, url, params, timeout or self.history_timeout)
         resp.raise_for_status()
-        instruments = resp.json().get("result", {}).get("data", [])
-        logger.info(f"Fetched {len(instruments)} instruments.")
+        try:
+            return json.loads(resp.content)["result"]["data"]
+        except (KeyError, TypeError):
+            return []
+
+    def _iter_data(
+        self, url: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[Timeout] = None
+    ) -> Iterator[Any]:
+        """
+        Streaming variant of _get_data for large responses: yields the result.data items one
+        at a time as the body arrives, without building the whole document.
+        """
+        resp = self._public_breaker.call(self._get, url, params, timeout or self.history_timeout, True)
+        with resp:
+            resp.raise_for_status()
+            yield from iter_array_items(resp.iter_content(self.STREAM_CHUNK_SIZE))
+
+    def _fetch_data(self, url: str, params: Dict[str, Any], count: int) -> Iterable[Any]:
+        # Streaming costs more per item than one json.loads, so only use it for large payloads
+        if count >= self.STREAM_MIN_COUNT:
+            return self._iter_data(url, params)
+        return self._get_data(url, params)
+
+    def _get(
+        self, url: str, params: Optional[Dict[str, Any]], timeout: Timeout, stream: bool = False
+    ) -> requests.Response:
+        # Transport and server errors count as failures for the circuit breaker, client errors do not
+        # Streamed bodies hold their pooled connection until closed, so every raising path releases it;
+        # once returned, the caller owns the response (_iter_data closes it with a with block)
+        resp = self.session.get(url, params=params, timeout=timeout, stream=stream)
+        try:
+            if resp.status_code >= 500:
+                resp.raise_for_status()
+            self._latency[url].append(resp.elapsed.total_seconds())
+        except BaseException:
+            resp.close()
+            raise
+        return resp
+
+    def get_instruments(self) -> List[Dict[str, Any]]:
+        """
+        Instrument definitions; kept on disk for an hour so restarts skip the download.
+        """
+        instruments = self._file_cache.get("instruments")
+        if instruments:
+            logger.info("Loaded %d instruments from disk cache.", len(instruments))
+            return instruments
+        instruments = self._get_data(self._url_instruments)
+        logger.info("Fetched %d instruments.", len(instruments))
+        if instruments:
+            self._file_cache.set("instruments", instruments, self.INSTRUMENTS_FILE_TTL)
         return instruments
 
     def _load_contracts(self) -> Dict[str, Contract]:
         instruments = self.get_instruments()
-        contracts: Dict[str, Contract] = {}
-        for inst in instruments:
-            try:
-                c = Contract.from_info(inst, "crypto")
-                contracts[c.symbol] = c
-            except Exception as e:
-                logger.warning(f"Skipping instrument {inst.get('instrument_name')}: {e}")
+        try:
+            contracts = {
+                c.symbol: c for c in [Contract.from_info(inst, "crypto") for inst in instruments]
+            }
+        except (KeyError, TypeError, ValueError):
+            # Slow path only when the batch failed: find and skip the malformed instruments
+            contracts = {}
+            for inst in instruments:
+                try:
+                    c = Contract.from_info(inst, "crypto")
+                    contracts[c.symbol] = c
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.warning("Skipping instrument %s: %s", inst.get("instrument_name"), e)
         self._add_log(f"Loaded {len(contracts)} trading contracts.")
         return contracts
 
     def get_order_book(
         self, instrument_name: str, depth: int = 10
     ) -> Dict[str, Any]:
+        """
+        Order book from the socket-maintained local copy when available, otherwise a REST snapshot.
+        The first call subscribes the instrument, so later ones are memory reads.
+        """
+        book = self._books.get(instrument_name)
+        if book is not None and depth <= self.BOOK_DEPTH:
+            return book.top(depth)
+        self._subscribe([f"book.{instrument_name}.{self.BOOK_DEPTH}"])
         try:
-            resp = self.session.get(
-                f"{self.base_url}/public/get-book",
-                params={"instrument_name": instrument_name, "depth": depth},
-                timeout=10,
+            data = self._get_data(
+                self._url_book, {"instrument_name": instrument_name, "depth": depth}, self.book_timeout
             )
-            resp.raise_for_status()
-            data = resp.json().get("result", {}).get("data", [])
             if data:
                 snap = data[0]
                 return {"bids": snap.get("bids", []), "asks": snap.get("asks", [])}
             return {"bids": [], "asks": []}
-        except Exception as e:
-            logger.error(f"get_order_book error: {e}")
+        except self.FETCH_ERRORS as e:
+            logger.error("get_order_book error: %s", e)
             self._add_log(f"Failed to fetch order book for {instrument_name}")
             return {"bids": [], "asks": []}
 
+    def get_order_books(
+        self, instrument_names: List[str], depth: int = 10
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch several order books concurrently, so N symbols cost about one round-trip instead of N.
+        """
+        books = self._executor.map(lambda name: self.get_order_book(name, depth), instrument_names)
+        return dict(zip(instrument_names, books))
+
+    def get_bid_ask(self, contract: Contract) -> Dict[str, Optional[float]]:
+        """
+        Best bid/ask from the top of the order book, also stored in self.prices.
+        """
+        return self.get_bid_asks([contract])[contract.symbol]
+
+    def request_bid_ask(self, contract: Contract):
+        """
+        Non-blocking get_bid_ask for the UI thread: subscribes the order book and fetches the first
+        price on the REST executor. Returns at once; the price shows up in self.prices.
+        The task fetches its one book itself: waiting on get_order_books from inside the executor
+        would hold a worker while its inner jobs queue for one, and deadlock a saturated pool.
+        """
+        symbol = contract.symbol
+        if symbol in self._bid_ask_pending:
+            return
+        self._bid_ask_pending.add(symbol)
+        self.subscribe_book([contract])
+
+        def done(future):
+            self._bid_ask_pending.discard(symbol)
+            if future.exception() is not None:
+                logger.error("Bid/ask fetch for %s failed: %s", symbol, future.exception())
+
+        self._executor.submit(self._fetch_bid_ask, symbol).add_done_callback(done)
+
+    def _fetch_bid_ask(self, symbol: str):
+        self._store_top(symbol, self.get_order_book(symbol, depth=1), time.monotonic())
+
+    def _store_top(self, symbol: str, book: Dict[str, Any], received: float) -> Dict[str, Optional[float]]:
+        """
+        Record the best bid/ask of a REST book snapshot in self.prices and return it.
+        """
+        bids, asks = book["bids"], book["asks"]
+        if not (bids and asks):
+            return {"bid": None, "ask": None}
+        self.prices[symbol] = {"bid": float(bids[0][0]), "ask": float(asks[0][0]), "_ts": received}
+        return self.prices[symbol]
+
+    def get_bid_asks(self, contracts: List[Contract]) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        Best bid/ask for several contracts, stored in self.prices. Symbols are subscribed to the
+        market socket, whose local books keep their prices current; REST is only the fallback,
+        fetched concurrently in one round for the symbols without a live book or a recent price.
+        """
+        self.subscribe_book(contracts)
+        now = time.monotonic()
+        result = {}
+        stale = []
+        for c in contracts:
+            entry = self.prices.get(c.symbol)
+            if entry is not None and (c.symbol in self._books or now - entry["_ts"] < self._bid_ask_ttl):
+                result[c.symbol] = entry
+            else:
+                stale.append(c.symbol)
+        if not stale:
+            return result
+
+        books = self.get_order_books(stale, depth=1)
+        received = time.monotonic()
+        for symbol, book in books.items():
+            result[symbol] = self._store_top(symbol, book, received)
+        return result
+
     def get_trades(
         self, instrument_name: str, count: int = 100
     ) -> List[Dict[str, Any]]:
+        """
+        Most recent trades, newest first. Served from the socket's trade buffer once it holds
+        count trades, otherwise from REST; the first call subscribes the instrument.
+        """
+        buffered = self._trades.get(instrument_name)
+        if buffered is not None and len(buffered) >= count:
+            return list(itertools.islice(buffered, count))
+        self._subscribe([f"trade.{instrument_name}"])
+        cache_key = ("trades", instrument_name, count)
+        trades = self._rest_cache.get(cache_key)
+        if trades is not None:
+            return list(trades)
         try:
-            resp = self.session.get(
-                f"{self.base_url}/public/get-trades",
-                params={"instrument_name": instrument_name, "count": count},
-                timeout=10,
-            )
-            resp.raise_for_status()
-            trades = resp.json().get("result", {}).get("data", [])
-            logger.info(f"Fetched {len(trades)} trades for {instrument_name}.")
-            return trades
-        except Exception as e:
-            logger.error(f"get_trades error: {e}")
+            trades = list(self._fetch_data(
+                self._url_trades, {"instrument_name": instrument_name, "count": count}, count
+            ))
+            logger.info("Fetched %d trades for %s.", len(trades), instrument_name)
+            self._rest_cache.set(cache_key, trades, self.TRADES_CACHE_TTL)
+            return list(trades)
+        except self.FETCH_ERRORS as e:
+            logger.error("get_trades error: %s", e)
             self._add_log(f"Failed to fetch trades for {instrument_name}")
             return []
 
-    def get_historical_candles(
+    def get_trades_for_instruments(
+        self, instrument_names: List[str], count: int = 100
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Recent trades for several instruments, fetched concurrently.
+        """
+        trades = self._executor.map(lambda name: self.get_trades(name, count), instrument_names)
+        return dict(zip(instrument_names, trades))
+
+    def get_candle_array(
         self,
         instrument_name: str,
         interval: str,
         count: int = 25,
         start_ts: Optional[int] = None,
         end_ts: Optional[int] = None,
-    ) -> List[Candle]:
+    ) -> np.ndarray:
+        """
+        Historical candles as a CANDLE_DTYPE structured array, e.g. arr["close"] for indicator maths.
+        Results are returned read-only and cached: briefly while the window includes the forming
+        candle, for good once end_ts lies a full interval in the past (then also on disk).
+        """
+        interval_ms = _INTERVAL_MS.get(interval)
+        if interval_ms is None:
+            raise ValueError(f"Unsupported candle interval: {interval}")
+        cache_key = ("candles", instrument_name, interval, count, start_ts, end_ts)
+        candles = self._rest_cache.get(cache_key)
+        if candles is not None:
+            return candles
+        closed = end_ts is not None and end_ts <= time.time_ns() // 1_000_000 - interval_ms
+        if closed:
+            rows = self._file_cache.get(cache_key)
+            if rows is not None:
+                candles = np.array([tuple(row) for row in rows], dtype=CANDLE_DTYPE)
+                candles.flags.writeable = False
+                self._rest_cache.set(cache_key, candles, None)
+                return candles
         params: Dict[str, Any] = {"instrument_name": instrument_name, "timeframe": interval, "count": count}
         if start_ts:
             params["start_ts"] = start_ts
         if end_ts:
             params["end_ts"] = end_ts
         try:
-            resp = self.session.get(
-                f"{self.base_url}/public/get-candlestick", params=params, timeout=10
+            data = self._fetch_data(self._url_candles, params, count)
+            candles = np.fromiter(
+                (
+                    (int(item["t"]), float(item["o"]), float(item["h"]),
+                     float(item["l"]), float(item["c"]), float(item["v"]))
+                    for item in data
+                ),
+                dtype=CANDLE_DTYPE,
+                # A streamed response has no length up front, so the array grows as items arrive
+                count=len(data) if isinstance(data, list) else -1,
             )
-            resp.raise_for_status()
-            data = resp.json().get("result", {}).get("data", [])
-            candles = [
-                Candle(
-                    timestamp=int(item["t"]),
-                    open=float(item["o"]),
-                    high=float(item["h"]),
-                    low=float(item["l"]),
-                    close=float(item["c"]),
-                    volume=float(item["v"]),
-                )
-                for item in data
-            ]
-            logger.info(f"Fetched {len(candles)} candles for {instrument_name}.")
+            logger.info("Fetched %d candles for %s.", len(candles), instrument_name)
+            candles.flags.writeable = False
+            self._rest_cache.set(cache_key, candles, None if closed else self.CANDLES_CACHE_TTL)
+            if closed:
+                self._file_cache.set(cache_key, candles.tolist(), None)
             return candles
-        except Exception as e:
-            logger.error(f"get_historical_candles error: {e}")
+        except self.FETCH_ERRORS as e:
+            logger.error("get_historical_candles error: %s", e)
             self._add_log(f"Failed to fetch historical data for {instrument_name}")
-            return []
+            return np.empty(0, dtype=CANDLE_DTYPE)
+
+    def get_candle_arrays(
+        self, instrument_names: List[str], interval: str, count: int = 25
+    ) -> Dict[str, np.ndarray]:
+        """
+        Latest candles for several instruments, fetched concurrently; see get_candle_array.
+        """
+        arrays = self._executor.map(
+            lambda name: self.get_candle_array(name, interval, count), instrument_names
+        )
+        return dict(zip(instrument_names, arrays))
+
+    def get_historical_candles(
+        self,
+        instrument_name: str,
+        interval: str,
+        count: int = 25,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None,
+    ) -> List[Candle]:
+        return candles_from_array(
+            self.get_candle_array(instrument_name, interval, count, start_ts, end_ts)
+        )
 
     def get_account_summary(self) -> List[Dict[str, Any]]:
         """Private account balances via JSON-RPC."""
         result = self._rpc("private/user-balance", {})
-        logger.debug(f"Raw account summary result: {result}")
+        logger.debug("Raw account summary result: %s", result)
         data = result.get("data", [])
-        logger.info(f"Fetched {len(data)} account balances.")
+        logger.info("Fetched %d account balances.", len(data))
         return data
 
     def _load_balances(self) -> Dict[str, Balance]:
@@ -223,27 +782,42 @@ class CryptoExchangeClient:
     def create_order(
         self,
         instrument_name: str,
-        side: str,
-        type_: str,
+        side: Union[Side, str],
+        type_: Union[OrderType, str],
         quantity: Union[str, float],
         price: Optional[Union[str, float]] = None,
         client_oid: Optional[str] = None,
     ) -> Dict[str, Any]:
+        """
+        Place an order. A client_oid is generated when none is given and sent with every attempt,
+        so transport retries cannot create duplicates. Calling again with the same client_oid is
+        also safe; use get_order_detail(client_oid=...) to find out whether the order landed.
+        The returned dict always carries the client_oid used, even when the request failed
+        and the rest of the result is empty.
+        """
+        # Normalise once and branch on identity; .value keeps str() of the enum out of the signature
+        side = side if isinstance(side, Side) else Side(side.upper())
+        order_type = type_ if isinstance(type_, OrderType) else OrderType(type_.upper())
+        if order_type is OrderType.LIMIT and price is None:
+            raise ValueError("Price required for LIMIT orders")
+        client_oid = client_oid or uuid.uuid4().hex
         params: Dict[str, Any] = {
             "instrument_name": instrument_name,
-            "side": side.upper(),
-            "type": type_.upper(),
+            "side": side.value,
+            "type": order_type.value,
             "quantity": str(quantity),
+            "client_oid": client_oid,
         }
-        if type_.upper() == "LIMIT":
-            if price is None:
-                raise ValueError("Price required for LIMIT orders")
+        if order_type is OrderType.LIMIT:
             params["price"] = str(price)
-        if client_oid:
-            params["client_oid"] = client_oid
         result = self._rpc("private/create-order", params)
-        self._add_log(f"Created order for {instrument_name}: {result}")
-        return result
+        if not result:
+            # The order may still have landed; client_oid is the only handle to look it up or retry safely
+            logger.error("Create order for %s returned no result (client_oid %s)", instrument_name, client_oid)
+            self._add_log(f"Create order for {instrument_name} failed, client_oid {client_oid}")
+        else:
+            self._add_log(f"Created order for {instrument_name}: {result}")
+        return {"client_oid": client_oid, **result}
 
     def cancel_order(
         self, order_id: str, instrument_name: str
@@ -255,16 +829,153 @@ class CryptoExchangeClient:
         self._add_log(f"Cancelled order {order_id} for {instrument_name}")
         return result
 
+    def get_order_detail(
+        self, order_id: Optional[str] = None, client_oid: Optional[str] = None
+    ) -> Dict[str, Any]:
+        if not order_id and not client_oid:
+            raise ValueError("order_id or client_oid required")
+        params = {"order_id": order_id} if order_id else {"client_oid": client_oid}
+        return self._rpc("private/get-order-detail", params)
+
     # WebSocket handling (market data only)
     def _start_ws(self):
+        """
+        Keep the market socket up: after any drop it reconnects, waiting longer after each
+        failed attempt up to WS_RECONNECT_MAX. _on_open re-sends the subscriptions.
+        """
+        self._ws = websocket.WebSocketApp(
+            self.ws_market_url,
+            on_open=self._on_open,
+            on_message=self._on_message,
+            on_error=lambda ws, err: logger.error("WS error: %s", err),
+            on_close=self._on_close,
+        )
+        delay = self.WS_RECONNECT_MIN
+        while True:
+            try:
+                # Text frames reach _on_message as raw bytes, json.loads decodes them itself. Pings make a
+                # dead link fail within seconds instead of waiting for a missed heartbeat.
+                self._ws.run_forever(skip_utf8_validation=True, ping_interval=20, ping_timeout=10)
+            except Exception as e:
+                logger.error("WebSocket failed: %s", e)
+            # A connection that came up resets the backoff; failed attempts double it
+            delay = self.WS_RECONNECT_MIN if self._ws_opened else min(delay * 2, self.WS_RECONNECT_MAX)
+            self._ws_opened = False
+            logger.info("Reconnecting market socket in %.0fs", delay)
+            time.sleep(delay)
+
+    def _on_open(self, ws):
+        """
+        Called once the market socket is connected. Works from the contracts loaded in __init__,
+        never from a new get_instruments() round-trip.
+        """
+        self._ws_connected = True
+        self._ws_opened = True
+        self._add_log("WS connected")
+        with self._ws_channels_lock:
+            channels = sorted(self._ws_channels)
+        self._send_subscribe(channels)
+
+    def _on_close(self, ws, code=None, msg=None):
+        self._ws_connected = False
+        # Updates are missed while disconnected: books and trade buffers are rebuilt on reconnect, and
+        # the prices the books fed are dropped so readers fall back to REST instead of a frozen quote
+        for symbol in list(self._books):
+            self.prices.pop(symbol, None)
+        self._books.clear()
+        self._trades.clear()
+        self._add_log(f"WS closed: {code}")
+
+    def _on_message(self, ws, msg: bytes):
         try:
-            ws = websocket.WebSocketApp(
-                self.ws_market_url,
-                on_open=lambda ws: self._add_log("WS connected"),
-                on_message=lambda ws, msg: None,
-                on_error=lambda ws, err: logger.error(f"WS error: {err}"),
-                on_close=lambda ws, code, msg: self._add_log(f"WS closed: {code}")
-            )
-            ws.run_forever()
-        except Exception as e:
-            logger.error(f"WebSocket failed: {e}")
\ No newline at end of file
+            data = json.loads(msg)
+            if data.get("method") == "public/heartbeat":
+                # The server drops the connection unless every heartbeat is answered
+                ws.send(json.dumps({"id": data["id"], "method": "public/respond-heartbeat"}))
+                return
+            result = data.get("result")
+            if not result:
+                return
+            channel = result.get("channel")
+            if channel == "book":
+                self._on_book_snapshot(result["instrument_name"], result["data"][0])
+            elif channel == "book.update":
+                self._on_book_update(result["instrument_name"], result["data"][0])
+            elif channel == "trade":
+                trades = self._trades.setdefault(
+                    result["instrument_name"], deque(maxlen=self.TRADE_BUFFER)
+                )
+                # Pushed newest first, like the REST endpoint; the buffer keeps that order
+                trades.extendleft(reversed(result["data"]))
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            logger.error("Failed to process WS message: %s", e)
+
+    def _on_book_snapshot(self, symbol: str, snapshot: Dict[str, Any]):
+        book = OrderBook(snapshot, snapshot["u"])
+        self._books[symbol] = book
+        self._update_price(symbol, book)
+
+    def _on_book_update(self, symbol: str, update: Dict[str, Any]):
+        book = self._books.get(symbol)
+        if book is None:
+            return
+        if not book.apply(update["update"], update.get("pu"), update["u"]):
+            # A delta was missed: drop the book and resubscribe for a fresh snapshot
+            logger.warning("Order book for %s out of sync, resubscribing", symbol)
+            del self._books[symbol]
+            channel = f"book.{symbol}.{self.BOOK_DEPTH}"
+            self._send_subscribe([channel], "unsubscribe")
+            self._send_subscribe([channel])
+            return
+        self._update_price(symbol, book)
+
+    def _update_price(self, symbol: str, book: OrderBook):
+        bid, ask = book.best()
+        if bid is not None and ask is not None:
+            self.prices[symbol] = {"bid": bid, "ask": ask, "_ts": time.monotonic()}
+
+    def subscribe_book(self, contracts: List[Contract]):
+        """
+        Keep a local order book for contracts, and their prices in self.prices, from the market
+        socket. Subscriptions are remembered, so they are sent once the socket is up and again
+        after a reconnect.
+        """
+        self._subscribe([f"book.{c.symbol}.{self.BOOK_DEPTH}" for c in contracts])
+
+    def subscribe_trades(self, contracts: List[Contract]):
+        """
+        Buffer the latest trades of contracts from the market socket, see get_trades.
+        """
+        self._subscribe([f"trade.{c.symbol}" for c in contracts])
+
+    def _subscribe(self, channels: List[str]):
+        with self._ws_channels_lock:
+            new = [ch for ch in channels if ch not in self._ws_channels]
+            self._ws_channels.update(new)
+        if not new:
+            return
+        if self._ws_connected:
+            self._send_subscribe(new)
+
+    def _send_subscribe(self, channels: List[str], method: str = "subscribe"):
+        # Book channels carry the delta-feed options, so they go in their own request
+        books = [ch for ch in channels if ch.startswith("book.")]
+        others = [ch for ch in channels if not ch.startswith("book.")]
+        book_options = {
+            "book_subscription_type": "SNAPSHOT_AND_UPDATE",
+            "book_update_frequency": self.BOOK_UPDATE_FREQUENCY_MS,
+        }
+        for group, options in ((books, book_options), (others, {})):
+            if not group:
+                continue
+            payload = {
+                "id": self._get_nonce(),
+                "method": method,
+                "params": {"channels": group, **options},
+                "nonce": self._get_nonce(),
+            }
+            try:
+                self._ws.send(json.dumps(payload))
+                logger.info("Sent %s for %d channels", method, len(group))
+            except (websocket.WebSocketException, OSError) as e:
+                logger.error("WS %s failed: %s", method, e)
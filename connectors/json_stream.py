@@ -0,0 +1,61 @@
+import json
+import codecs
+import re
+from typing import Any, Iterable, Iterator
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+
+
+def iter_array_items(chunks: Iterable[bytes], key: str = "data") -> Iterator[Any]:
+    """
+    Yield the items of the first JSON array stored under key, decoding them one at a time
+    from a stream of byte chunks (e.g. resp.iter_content()). Only the current item and the
+    unparsed tail of the stream are held in memory, never the whole document.
+    Yields nothing if the key is not found; raises ValueError on a truncated array.
+    """
+    start = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buf = ""
+
+    # Skip ahead to the opening bracket of the array
+    for chunk in chunks:
+        buf += utf8.decode(chunk)
+        match = start.search(buf)
+        if match:
+            buf = buf[match.end():]
+            break
+        # Keep enough of the tail to match a key split across two chunks
+        buf = buf[-(len(key) + 16):]
+    else:
+        return
+
+    pos = 0
+    exhausted = False
+    while True:
+        while pos < len(buf) and (buf[pos] in _WHITESPACE or buf[pos] == ","):
+            pos += 1
+        if pos < len(buf) and buf[pos] == "]":
+            return
+        try:
+            item, end = _DECODER.raw_decode(buf, pos)
+            # A number cut by the chunk boundary ("2." of "2.5") still decodes: the item is only
+            # known to be whole once a delimiter follows it or the stream has ended
+            complete = exhausted or (end < len(buf) and buf[end] in _DELIMITERS)
+        except json.JSONDecodeError:
+            if exhausted:
+                raise ValueError(f"Truncated JSON array under '{key}'")
+            complete = False
+        if complete:
+            pos = end
+            yield item
+            continue
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            buf = buf[pos:] + utf8.decode(b"", final=True)
+        else:
+            buf = buf[pos:] + utf8.decode(chunk)
+        pos = 0
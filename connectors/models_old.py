@@ -1,9 +1,9 @@
-import dateutil.parser
 import datetime
 
 
 BITMEX_MULTIPLIER = 0.00000001
 BITMEX_TF_MINUTES = {"1m": 1, "5m": 5, "1h": 60, "1d": 1440}
+BITMEX_TF_DELTA = {tf: datetime.timedelta(minutes=m) for tf, m in BITMEX_TF_MINUTES.items()}
 
 
 class Balance:
@@ -34,10 +34,10 @@ class Candle:
             self.volume = float(candle_info[5])
 
         elif exchange == "crypto":
-            self.timestamp = dateutil.parser.isoparse(candle_info["timestamp"])
-            self.timestamp = self.timestamp - datetime.timedelta(
-                minutes=BITMEX_TF_MINUTES[timeframe]
-            )
+            timestamp = candle_info["timestamp"]
+            if timestamp.endswith("Z"):
+                timestamp = timestamp[:-1] + "+00:00"
+            self.timestamp = datetime.datetime.fromisoformat(timestamp) - BITMEX_TF_DELTA[timeframe]
             self.timestamp = int(self.timestamp.timestamp() * 1000)
             self.open = candle_info["open"]
             self.high = candle_info["high"]
@@ -0,0 +1,48 @@
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class OrderBook:
+    """
+    Local copy of one instrument's order book, built from a snapshot and kept current with the
+    exchange's delta updates. Levels are kept as received: [price, quantity, order count] strings.
+    Updated by the socket thread while REST workers read it, hence the lock.
+    """
+
+    def __init__(self, snapshot: Dict[str, Any], update_id: int):
+        self._lock = threading.Lock()
+        self._bids = {level[0]: level for level in snapshot.get("bids", [])}
+        self._asks = {level[0]: level for level in snapshot.get("asks", [])}
+        self.update_id = update_id
+
+    def apply(self, delta: Dict[str, Any], prev_update_id: Optional[int], update_id: int) -> bool:
+        """
+        Apply a delta; a level with zero quantity is removed. Returns False, leaving the book
+        untouched, when the delta does not follow the last applied update (book out of sync).
+        """
+        with self._lock:
+            if prev_update_id != self.update_id:
+                return False
+            for side, levels in ((self._bids, delta.get("bids", ())), (self._asks, delta.get("asks", ()))):
+                for level in levels:
+                    if float(level[1]) == 0:
+                        side.pop(level[0], None)
+                    else:
+                        side[level[0]] = level
+            self.update_id = update_id
+            return True
+
+    def top(self, depth: int) -> Dict[str, List[List[str]]]:
+        """
+        Best depth levels per side, in the same shape as the REST get-book snapshot.
+        """
+        with self._lock:
+            bids = sorted(self._bids.values(), key=lambda level: float(level[0]), reverse=True)
+            asks = sorted(self._asks.values(), key=lambda level: float(level[0]))
+        return {"bids": bids[:depth], "asks": asks[:depth]}
+
+    def best(self) -> Tuple[Optional[float], Optional[float]]:
+        with self._lock:
+            bid = max(map(float, self._bids), default=None)
+            ask = min(map(float, self._asks), default=None)
+        return bid, ask
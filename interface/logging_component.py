@@ -5,9 +5,13 @@ from interface.styling import *
 
 
 class Logging(tk.Frame):
+    MAX_LINES = 2000
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        self._pending = []
+
         self.logging_text = tk.Text(
             self, 
             height=10, 
@@ -23,10 +27,23 @@ class Logging(tk.Frame):
 
     def add_log(self, message: str):
         """
-        Add a new log message to the tk.Text widget, placed at the top, with the current UTC time in front of it.
+        Queue a new log message, with the current UTC time in front of it. It is shown on the next flush().
         :param message: The new log message.
         :return:
         """
+        self._pending.append(datetime.utcnow().strftime("%a %H:%M:%S :: ") + message + "\n")
+
+    def flush(self):
+        """
+        Write the queued messages to the tk.Text widget in one insert, newest at the top,
+        and drop the oldest lines beyond MAX_LINES.
+        :return:
+        """
+        if not self._pending:
+            return
+        text = "".join(reversed(self._pending))
+        self._pending.clear()
         self.logging_text.configure(state=tk.NORMAL)  # Unlocks the tk.Text widgets
-        self.logging_text.insert("1.0", datetime.utcnow().strftime("%a %H:%M:%S :: ") + message + "\n")
+        self.logging_text.insert("1.0", text)
+        self.logging_text.delete(f"{self.MAX_LINES + 1}.0", tk.END)
         self.logging_text.configure(state=tk.DISABLED)  # Locks the tk.Text widget to avoid accidentally inserting in it
\ No newline at end of file
@@ -2,6 +2,8 @@ import tkinter as tk
 from tkinter.messagebox import askquestion
 import logging
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from connectors.crypto_exchange import CryptoExchangeClient
 from connectors.binance_exchange import BinanceExchangeClient
@@ -12,11 +14,23 @@ from interface.watchlist_component import Watchlist
 from interface.trades_component import TradesWatch
 from interface.strategy_component import StrategyEditor
 
+from database import WorkspaceData
+
 
 logger = logging.getLogger()
 
+# Bound formatters by number of decimals: no format spec is built or looked up per price
+_PRICE_FMT = tuple(("{:.%df}" % decimals).format for decimals in range(16))
+
+# Compact encoding for the extra_params column; json.loads reads it back like the spaced form
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
 
 class Root(tk.Tk):
+    # _update_ui runs at the fast interval while values keep changing and backs off to the slow one when idle
+    UI_MIN_INTERVAL_MS = 50
+    UI_MAX_INTERVAL_MS = 1500
+
     def __init__(self, binance: BinanceExchangeClient, crypto: CryptoExchangeClient):
         super().__init__()
 
@@ -63,6 +77,19 @@ class Root(tk.Tk):
         self._trades_frame = TradesWatch(self._right_frame, bg=BG_COLOR)
         self._trades_frame.pack(side=tk.TOP, pady=15)
 
+        # Watchlist row key -> price formatter (None for an unknown symbol), filled on the row's first update
+        self._watchlist_cache = {}
+        # Trade time -> PnL formatter; a trade's contract, and so its precision, never changes
+        self._pnl_fmt = {}
+        # (field, row key) -> text currently shown, so unchanged values are not set again
+        self._last_set = {}
+        self._poll_interval = self.UI_MAX_INTERVAL_MS
+
+        # Database writes run here so a slow commit never freezes the window; it reports back through log_queue
+        self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="workspace-save")
+        self.log_queue = deque()
+
+        self._update_logs()
         self._update_ui()
 
     def _ask_before_close(self):
@@ -80,125 +107,163 @@ class Root(tk.Tk):
                 
             self.destroy()
 
+    def _update_logs(self):
+        """
+        Moves new log messages to the logging component every 100ms, so they show up almost immediately.
+        Checking the empty queues is all an idle tick costs.
+        """
+        queues = [self.log_queue, self.crypto.log_queue, self.binance.log_queue]
+        for client in [self.binance, self.crypto]:
+            queues.extend(strat.log_queue for strat in list(getattr(client, 'strategies', {}).values()))
+
+        for log_queue in queues:
+            while log_queue:
+                self.logging_frame.add_log(log_queue.popleft())
+
+        self.logging_frame.flush()
+
+        self.after(100, self._update_logs)
+
+    def _set_var(self, var: tk.StringVar, field: str, key, text: str) -> bool:
+        """
+        Sets a table cell's StringVar. Returns False, without a Tcl call, if the cell already shows text.
+        """
+        if self._last_set.get((field, key)) == text:
+            return False
+        self._last_set[(field, key)] = text
+        var.set(text)
+        return True
+
     def _update_ui(self):
         """
-        Updates the UI components every 1500ms. Thread-safe method to update Tkinter elements.
+        Updates the UI components: every 50ms while trades or prices change, slowing down to every 1500ms
+        when nothing does. Thread-safe method to update Tkinter elements.
         """
-        # Logs
-        for log in self.crypto.logs:
-            if not log["displayed"]:
-                self.logging_frame.add_log(log["log"])
-                log["displayed"] = True
+        if not self.winfo_viewable():
+            # Minimized or withdrawn: nothing is drawn, so widgets are refreshed once the window is back
+            self._poll_interval = self.UI_MAX_INTERVAL_MS
+            self.after(self._poll_interval, self._update_ui)
+            return
 
-        for log in self.binance.logs:
-            if not log["displayed"]:
-                self.logging_frame.add_log(log["log"])
-                log["displayed"] = True
+        work_done = False
 
         # Strategies and Trades (if implemented)
+        trade_widgets = self._trades_frame.body_widgets
+        trade_symbols = trade_widgets['symbol']
+        pnl_vars = trade_widgets['pnl_var']
+        status_vars = trade_widgets['status_var']
+        quantity_vars = trade_widgets['quantity_var']
+
         for client in [self.binance, self.crypto]:
             try:
-                if hasattr(client, 'strategies'):
-                    for b_index, strat in client.strategies.items():
-                        for log in strat.logs:
-                            if not log['displayed']:
-                                self.logging_frame.add_log(log['log'])
-                                log['displayed'] = True
-                        
+                strategies = getattr(client, 'strategies', None)
+                if strategies is not None:
+                    for strat in strategies.values():
                         # Update trades information
                         for trade in strat.trades:
-                            if trade.time not in self._trades_frame.body_widgets['symbol']:
+                            if trade.time not in trade_symbols:
                                 self._trades_frame.add_trade(trade)
-                            
-                            if "binance" in trade.contract.exchange:
-                                precision = trade.contract.price_decimals
-                            else:
-                                precision = 8  # The Crypto PNL precision (adjust if needed)
-                            
-                            if hasattr(self._trades_frame.body_widgets, 'pnl_var') and trade.time in self._trades_frame.body_widgets['pnl_var']:
-                                pnl_str = "{0:.{prec}f}".format(trade.pnl, prec=precision)
-                                self._trades_frame.body_widgets['pnl_var'][trade.time].set(pnl_str)
-                                
-                            if hasattr(self._trades_frame.body_widgets, 'status_var') and trade.time in self._trades_frame.body_widgets['status_var']:
-                                self._trades_frame.body_widgets['status_var'][trade.time].set(trade.status.capitalize())
-                                
-                            if hasattr(self._trades_frame.body_widgets, 'quantity_var') and trade.time in self._trades_frame.body_widgets['quantity_var']:
-                                self._trades_frame.body_widgets['quantity_var'][trade.time].set(trade.quantity)
+                                work_done = True
+
+                            pnl_fmt = self._pnl_fmt.get(trade.time)
+                            if pnl_fmt is None:
+                                if "binance" in trade.contract.exchange:
+                                    precision = trade.contract.price_decimals
+                                else:
+                                    precision = 8  # The Crypto PNL precision (adjust if needed)
+                                pnl_fmt = self._pnl_fmt[trade.time] = _PRICE_FMT[precision]
+
+                            if trade.time in pnl_vars:
+                                work_done |= self._set_var(
+                                    pnl_vars[trade.time], 'pnl', trade.time, pnl_fmt(trade.pnl)
+                                )
+
+                            if trade.time in status_vars:
+                                work_done |= self._set_var(
+                                    status_vars[trade.time], 'status', trade.time, trade.status.capitalize()
+                                )
+
+                            if trade.time in quantity_vars:
+                                work_done |= self._set_var(
+                                    quantity_vars[trade.time], 'quantity', trade.time, str(trade.quantity)
+                                )
             except RuntimeError as e:
                 logger.error("Error while looping through strategies dictionary: %s", e)
             except AttributeError as e:
                 logger.error("Attribute error during strategy update: %s", e)
 
         # Watchlist prices
-        try:
-            for key, value in self._watchlist_frame.body_widgets['symbol'].items():
-                symbol = self._watchlist_frame.body_widgets['symbol'][key].cget("text")
-                exchange = self._watchlist_frame.body_widgets['exchange'][key].cget("text")
+        for key in [k for k in self._watchlist_cache if k not in self._watchlist_frame.rows]:
+            # The row was removed from the watchlist
+            del self._watchlist_cache[key]
+            self._last_set.pop(('bid', key), None)
+            self._last_set.pop(('ask', key), None)
+
+        bid_vars = self._watchlist_frame.body_widgets['bid_var']
+        # Socket state is only read here, once per tick
+        binance_ws_ready = self.binance.ws_connected and bool(self.binance.ws_subscriptions)
+        binance_book_subs = self.binance.ws_subscriptions.get("bookTicker", ())
+        ask_vars = self._watchlist_frame.body_widgets['ask_var']
+        for key, (symbol, exchange) in list(self._watchlist_frame.rows.items()):
+            try:
+                if key not in self._watchlist_cache:
+                    # A row's symbol, and so its precision, never changes
+                    client = {"Binance": self.binance, "Crypto": self.crypto}.get(exchange)
+                    fmt = None
+                    if client is not None and symbol in client.contracts:
+                        fmt = _PRICE_FMT[client.contracts[symbol].price_decimals]
+                    self._watchlist_cache[key] = fmt
+
+                fmt = self._watchlist_cache[key]
+                if fmt is None:
+                    continue
 
                 if exchange == "Binance":
-                    if symbol not in self.binance.contracts:
-                        continue
-
                     # Subscribe to symbol if needed and WebSocket is available
-                    if hasattr(self.binance, 'subscribe_channel'):
-                        ws_connected = getattr(self.binance, 'ws_connected', False)
-                        ws_subscriptions = getattr(self.binance, 'ws_subscriptions', {})
-                        
-                        if ws_connected and ws_subscriptions and symbol not in ws_subscriptions.get("bookTicker", []):
-                            self.binance.subscribe_channel([self.binance.contracts[symbol]], "bookTicker")
+                    if binance_ws_ready and symbol not in binance_book_subs:
+                        self.binance.subscribe_channel([self.binance.contracts[symbol]], "bookTicker")
 
                     if symbol not in self.binance.prices:
                         self.binance.get_bid_ask(self.binance.contracts[symbol])
                         continue
 
-                    precision = self.binance.contracts[symbol].price_decimals
                     prices = self.binance.prices[symbol]
 
-                elif exchange == "Crypto":
-                    if symbol not in self.crypto.contracts:
-                        continue
-
+                else:
                     if symbol not in self.crypto.prices:
+                        # Subscribes the symbol's order book and fetches a first price in the background;
+                        # this tick only ever reads self.crypto.prices
+                        self.crypto.request_bid_ask(self.crypto.contracts[symbol])
                         continue
 
-                    precision = self.crypto.contracts[symbol].price_decimals
                     prices = self.crypto.prices[symbol]
-                else:
-                    continue
 
                 if prices.get('bid') is not None:
-                    price_str = "{0:.{prec}f}".format(prices['bid'], prec=precision)
-                    self._watchlist_frame.body_widgets['bid_var'][key].set(price_str)
-                    
+                    work_done |= self._set_var(bid_vars[key], 'bid', key, fmt(prices['bid']))
+
                 if prices.get('ask') is not None:
-                    price_str = "{0:.{prec}f}".format(prices['ask'], prec=precision)
-                    self._watchlist_frame.body_widgets['ask_var'][key].set(price_str)
+                    work_done |= self._set_var(ask_vars[key], 'ask', key, fmt(prices['ask']))
 
-        except RuntimeError as e:
-            logger.error("Error while looping through watchlist dictionary: %s", e)
-        except KeyError as e:
-            logger.error(f"Key error in watchlist update: {e}")
+            except KeyError as e:
+                # A row removed or a price dropped mid-update only skips that row
+                logger.error("Key error in watchlist update: %s", e)
 
-        self.after(1500, self._update_ui)
+        if work_done:
+            self._poll_interval = self.UI_MIN_INTERVAL_MS
+        else:
+            self._poll_interval = min(self.UI_MAX_INTERVAL_MS, self._poll_interval * 2)
+        self.after(self._poll_interval, self._update_ui)
 
     def _save_workspace(self):
         """
-        Saves the current workspace configuration.
+        Saves the current workspace configuration. The values are read from the widgets here, on the Tk thread,
+        and written to the database on the save thread.
         """
         # Watchlist
-        try:
-            watchlist_symbols = []
-            for key, value in self._watchlist_frame.body_widgets['symbol'].items():
-                symbol = value.cget("text")
-                exchange = self._watchlist_frame.body_widgets['exchange'][key].cget("text")
-                watchlist_symbols.append((symbol, exchange,))
-
-            if hasattr(self._watchlist_frame, 'db'):
-                self._watchlist_frame.db.save("watchlist", watchlist_symbols)
-        except Exception as e:
-            logger.error(f"Error saving watchlist: {e}")
+        watchlist_symbols = list(self._watchlist_frame.rows.values())
 
         # Strategies
+        strategies = None
         try:
             if hasattr(self._strategy_frame, 'body_widgets') and hasattr(self._strategy_frame, 'extra_params'):
                 strategies = []
@@ -222,12 +287,27 @@ class Root(tk.Tk):
                     
                     strategies.append((
                         strategy_type, contract, timeframe, balance_pct, 
-                        take_profit, stop_loss, json.dumps(extra_params),
+                        take_profit, stop_loss, _encode_json(extra_params),
                     ))
-                
-                if hasattr(self._strategy_frame, 'db'):
-                    self._strategy_frame.db.save("strategies", strategies)
         except Exception as e:
-            logger.error(f"Error saving strategies: {e}")
+            logger.error(f"Error reading strategies: {e}")
+            strategies = None
+
+        self._save_executor.submit(self._write_workspace, watchlist_symbols, strategies)
+
+    def _write_workspace(self, watchlist_symbols: list, strategies: list):
+        """
+        Runs on the save thread: must not touch Tk widgets.
+        """
+        try:
+            db = WorkspaceData()  # sqlite3 connections cannot be used from another thread than their own
+            db.save("watchlist", watchlist_symbols)
+            if strategies is not None:
+                db.save("strategies", strategies)
+            db.conn.close()
+        except Exception as e:
+            logger.error(f"Error saving workspace: {e}")
+            self.log_queue.append("Failed to save workspace")
+            return
 
-        self.logging_frame.add_log("Workspace saved")
\ No newline at end of file
+        self.log_queue.append("Workspace saved")
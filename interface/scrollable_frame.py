@@ -14,6 +14,7 @@ class ScrollableFrame(tk.Frame):
         self.canvas = tk.Canvas(self, highlightthickness=0, **kwargs)
         self.vsb = tk.Scrollbar(self, orient=tk.VERTICAL, command=self.canvas.yview)
         self.sub_frame = tk.Frame(self.canvas, **kwargs)
+        self._scrollregion_pending = False
 
         self.sub_frame.bind("<Configure>", self._on_frame_configure)
         self.sub_frame.bind("<Enter>", self._activate_mousewheel)
@@ -29,11 +30,24 @@ class ScrollableFrame(tk.Frame):
     def _on_frame_configure(self, event: tk.Event):
 
         """
-        Makes the whole canvas content (defined by the .bbox("all") coordinates) scrollable.
+        Schedules a scrollregion update. Adding or removing a row fires this once per widget, so the updates
+        are coalesced into a single one when Tk is next idle.
         :param event:
         :return:
         """
 
+        if not self._scrollregion_pending:
+            self._scrollregion_pending = True
+            self.after_idle(self._update_scrollregion)
+
+    def _update_scrollregion(self):
+
+        """
+        Makes the whole canvas content (defined by the .bbox("all") coordinates) scrollable.
+        :return:
+        """
+
+        self._scrollregion_pending = False
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
     def _activate_mousewheel(self, event: tk.Event):
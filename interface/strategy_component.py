@@ -219,8 +219,12 @@ class StrategyEditor(tk.Frame):
         :param b_index: The index of the row to delete
         """
         for element in self._base_params:
-            self.body_widgets[element['code_name']][b_index].grid_forget()
-            del self.body_widgets[element['code_name']][b_index]
+            code_name = element['code_name']
+            # Destroyed rather than hidden, so Tk only ever holds the widgets of the rows in the table
+            self.body_widgets[code_name].pop(b_index).destroy()
+            self.body_widgets.get(code_name + "_var", {}).pop(b_index, None)
+
+        self.additional_parameters.pop(b_index, None)
 
     def _show_popup(self, b_index: int):
         """
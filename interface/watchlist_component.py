@@ -74,6 +74,8 @@ class Watchlist(tk.Frame):
         self._crypto_entry.grid(row=1, column=1)
 
         self.body_widgets = dict()
+        # Row index -> (symbol, exchange), so readers need not query the labels through Tcl
+        self.rows: typing.Dict[int, typing.Tuple[str, str]] = dict()
 
         self._headers = ["symbol", "exchange", "bid", "ask", "remove"]
         
@@ -129,8 +131,9 @@ class Watchlist(tk.Frame):
 
     def _remove_symbol(self, b_index: int):
         for h in self._headers:
-            self.body_widgets[h][b_index].grid_forget()
-            del self.body_widgets[h][b_index]
+            self.body_widgets[h].pop(b_index).destroy()
+            self.body_widgets.get(h + "_var", {}).pop(b_index, None)
+        del self.rows[b_index]
 
     def _add_binance_symbol(self, event):
         symbol = event.widget.get()
@@ -146,6 +149,7 @@ class Watchlist(tk.Frame):
 
     def _add_symbol(self, symbol: str, exchange: str):
         b_index = self._body_index
+        self.rows[b_index] = (symbol, exchange)
 
         self.body_widgets['symbol'][b_index] = tk.Label(
             self._body_frame.sub_frame,
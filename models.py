@@ -1,5 +1,30 @@
+import sys
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from enum import Enum
+from typing import Optional, Dict, Any, List
+
+import numpy as np
+
+
+# Columnar candle layout: one packed record per candle instead of a Python object per candle
+CANDLE_DTYPE = np.dtype([
+    ("timestamp", "i8"),
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "f8"),
+])
+
+
+class Side(str, Enum):
+    BUY = "BUY"
+    SELL = "SELL"
+
+
+class OrderType(str, Enum):
+    LIMIT = "LIMIT"
+    MARKET = "MARKET"
 
 
 def tick_to_decimals(tick_size: float) -> int:
@@ -12,7 +37,7 @@ def tick_to_decimals(tick_size: float) -> int:
     return 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Balance:
     """
     Account balance representation for different exchanges.
@@ -42,7 +67,7 @@ class Balance:
             raise ValueError(f"Unsupported exchange: {exchange}")
 
 
-@dataclass
+@dataclass(slots=True)
 class Candle:
     """
     Historical price candle data.
@@ -96,7 +121,14 @@ class Candle:
             raise ValueError(f"Unsupported exchange: {exchange}")
 
 
-@dataclass
+def candles_from_array(arr: np.ndarray) -> List["Candle"]:
+    """
+    Materialize Candle objects from a CANDLE_DTYPE array, for callers that need mutable candles.
+    """
+    return [Candle(*row) for row in arr.tolist()]
+
+
+@dataclass(slots=True, frozen=True)
 class Contract:
     """
     Market contract/instrument representation.
@@ -137,8 +169,8 @@ class Contract:
             
             return cls(
                 symbol=info["symbol"],
-                base_asset=info["baseAsset"],
-                quote_asset=info["quoteAsset"],
+                base_asset=sys.intern(info["baseAsset"]),
+                quote_asset=sys.intern(info["quoteAsset"]),
                 price_decimals=price_decimals,
                 quantity_decimals=quantity_decimals,
                 tick_size=tick_size,
@@ -150,6 +182,9 @@ class Contract:
             symbol = info.get("instrument_name", info.get("symbol"))
             base_asset = info.get("base_coin", info.get("baseAsset"))
             quote_asset = info.get("quote_coin", info.get("quoteAsset"))
+            # Few distinct assets across many contracts: share one string object per asset
+            base_asset = sys.intern(base_asset) if base_asset else base_asset
+            quote_asset = sys.intern(quote_asset) if quote_asset else quote_asset
             tick_size = float(info.get("tick_size", info.get("price_tick_size", 0.00001)))
             lot_size = float(info.get("lot_size", info.get("qty_tick_size", 0.00001)))
             price_decimals = tick_to_decimals(tick_size)
@@ -168,7 +203,7 @@ class Contract:
             raise ValueError(f"Unsupported exchange: {exchange}")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OrderStatus:
     """
     Status report for an order.
@@ -203,7 +238,7 @@ class OrderStatus:
             raise ValueError(f"Unsupported exchange: {exchange}")
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """
     Represents a trade with entry and exit information.
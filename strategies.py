@@ -1,7 +1,10 @@
 import logging
 from typing import *
+from typing import Deque
 import time
+from collections import deque
 from threading import Timer
+import numpy as np
 import pandas as pd
 
 from models import *
@@ -35,11 +38,11 @@ class Strategy:
 
         self.candles: List[Candle] = []
         self.trades: List[Trade] = []
-        self.logs = []
+        self.log_queue: Deque[str] = deque()
 
     def _add_log(self, msg: str):
         logger.info("%s", msg)
-        self.logs.append({"log": msg, "displayed": False})
+        self.log_queue.append(msg)
 
     def parse_trades(self, price: float, size: float, timestamp: int) -> str:
         """
@@ -290,13 +293,20 @@ class TechnicalStrategy(Strategy):
         self._ema_signal = other_params['ema_signal']
         self._rsi_length = other_params['rsi_length']
 
+    def _closes(self) -> pd.Series:
+        """
+        Close prices as a float64 column, packed straight from the candles without an
+        intermediate list of Python floats.
+        """
+        return pd.Series(np.fromiter((candle.close for candle in self.candles), dtype=np.float64,
+                                     count=len(self.candles)))
+
     def _rsi(self) -> float:
         """
         Compute the Relative Strength Index.
         :return: The RSI value of the previous candlestick
         """
-        close_list = [candle.close for candle in self.candles]
-        closes = pd.Series(close_list)
+        closes = self._closes()
 
         # Calculate the different between the value of one row and the value of the row before
         delta = closes.diff().dropna()
@@ -320,8 +330,7 @@ class TechnicalStrategy(Strategy):
         Compute the MACD and its Signal line.
         :return: The MACD and the MACD Signal value of the previous candlestick
         """
-        close_list = [candle.close for candle in self.candles]
-        closes = pd.Series(close_list)
+        closes = self._closes()
 
         ema_fast = closes.ewm(span=self._ema_fast).mean()
         ema_slow = closes.ewm(span=self._ema_slow).mean()
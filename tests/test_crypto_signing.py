@@ -0,0 +1,42 @@
+import hashlib
+import hmac
+import unittest
+
+from connectors.crypto_exchange import CryptoExchangeClient, _encode_params
+
+
+def _client(api_key: str = "key", api_secret: str = "secret") -> CryptoExchangeClient:
+    # Only the signing state: no credentials lookup, network or socket
+    client = CryptoExchangeClient.__new__(CryptoExchangeClient)
+    client.api_key = api_key
+    key = api_secret.encode().ljust(CryptoExchangeClient.HMAC_BLOCK_SIZE, b"\0")
+    client._hmac_inner = hashlib.sha256(bytes(b ^ 0x36 for b in key))
+    client._hmac_outer = hashlib.sha256(bytes(b ^ 0x5C for b in key))
+    return client
+
+
+class EncodeParamsTest(unittest.TestCase):
+    def test_flat_params_sorted_by_key(self):
+        self.assertEqual(_encode_params({"b": "2", "a": 1, "c": None}), "a1b2cnull")
+
+    def test_nested_dict(self):
+        self.assertEqual(_encode_params({"p": {"b": "2", "a": "1"}, "x": "y"}), "pa1b2xy")
+
+    def test_list_of_lists(self):
+        self.assertEqual(_encode_params({"l": [["a", "b"], ["c"]]}), "labc")
+
+    def test_list_of_dicts(self):
+        self.assertEqual(_encode_params({"orders": [{"q": "1", "p": None}, {"q": "2"}]}), "orderspnullq1q2")
+
+
+class SignTest(unittest.TestCase):
+    def test_matches_hmac_sha256(self):
+        client = _client()
+        params = {"p": {"b": "2", "a": "1"}, "l": [["x"], ["y", "z"]]}
+        base = "private/create-order" + "7" + "key" + "lxyzpa1b2" + "7"
+        expected = hmac.new(b"secret", base.encode(), hashlib.sha256).hexdigest()
+        self.assertEqual(client._sign("private/create-order", params, 7), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
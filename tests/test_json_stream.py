@@ -0,0 +1,33 @@
+import unittest
+
+from connectors.json_stream import iter_array_items
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class IterArrayItemsTest(unittest.TestCase):
+    def test_whole_document(self):
+        self.assertEqual(list(iter_array_items([b'{"code":0,"data":[{"a":1},{"b":2}]}'])), [{"a": 1}, {"b": 2}])
+
+    def test_number_cut_at_chunk_boundary(self):
+        data = b'{"data":[1, 2.5]}'
+        self.assertEqual(list(iter_array_items(_chunks(data, 7))), [1, 2.5])
+
+    def test_every_chunk_size(self):
+        data = '{"result":{"data":[125, -0.75, 1e3, "é", true, null, {"k":[1,2]}]}}'.encode()
+        expected = [125, -0.75, 1000.0, "é", True, None, {"k": [1, 2]}]
+        for size in range(1, len(data) + 1):
+            self.assertEqual(list(iter_array_items(_chunks(data, size))), expected, size)
+
+    def test_missing_key_yields_nothing(self):
+        self.assertEqual(list(iter_array_items([b'{"other":[1]}'])), [])
+
+    def test_truncated_array_raises(self):
+        with self.assertRaises(ValueError):
+            list(iter_array_items([b'{"data":[1, {"a":']))
+
+
+if __name__ == "__main__":
+    unittest.main()